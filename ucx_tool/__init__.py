@@ -14,6 +14,8 @@
 import bpy
 import bmesh
 import re
+import time
+import numpy as np
 from mathutils import Vector
 from bpy.types import Operator, Panel, PropertyGroup
 from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty, CollectionProperty, PointerProperty
@@ -29,6 +31,25 @@ bl_info = {
     "category": "UCX",
 }
 
+# Seconds between batch timer ticks and the work budget spent per tick
+BATCH_TIMER_STEP = 0.01
+BATCH_TIME_SLICE = 0.05
+
+# Local axis index used for symmetry detection
+SYMMETRY_AXES = {'X': 0, 'Y': 1, 'Z': 2}
+
+# Point sets larger than this are hulled directly instead of compared for symmetry
+SYMMETRY_MAX_POINTS = 200000
+
+# Custom property on a collision object pointing to its source object
+UCX_SOURCE_PROP = "ucx_source"
+
+# Source object session uid -> collision object names, rebuilt lazily
+_collision_registry = None
+
+# Number of objects in the file when the registry was last in sync
+_collision_registry_size = 0
+
 @persistent
 def on_selection_changed(scene):
     current_active = bpy.context.active_object
@@ -38,6 +59,15 @@ def on_selection_changed(scene):
         fetch_vg(scene)
         scene.last_active_object = current_active
 
+@persistent
+def on_load_post(dummy):
+    invalidate_collision_registry()
+
+@persistent
+def on_undo_redo(dummy):
+    # Undo and redo can bring back or remove collisions behind the registry
+    invalidate_collision_registry()
+
 @persistent
 def on_checkbox_changed(scene):
     current_checkbox_value = scene.ucx_chkbox.ucx_chkbox
@@ -48,9 +78,121 @@ def on_checkbox_changed(scene):
         scene.last_checkbox_value = current_checkbox_value
         
 # Utility Functions
-def get_vertex_count(obj, vg):
-    """Count vertices in a vertex group."""
-    return sum(1 for v in obj.data.vertices if vg.index in [g.group for g in v.groups])
+def iter_vertex_group_members(obj):
+    """Yield (group index, vertex) for every vertex group membership of the object.
+
+    In edit mode this reads the edit BMesh deform layer directly, so the
+    result is up to date without toggling to object mode.
+    """
+    if obj.mode == 'EDIT':
+        bm = bmesh.from_edit_mesh(obj.data)
+        deform = bm.verts.layers.deform.active
+        if deform is None:
+            return
+
+        for v in bm.verts:
+            for index in v[deform].keys():
+                yield index, v
+    else:
+        for v in obj.data.vertices:
+            for g in v.groups:
+                yield g.group, v
+
+def get_vertex_counts(obj):
+    """Count vertices of every vertex group in a single pass."""
+    counts = {}
+    for index, _ in iter_vertex_group_members(obj):
+        counts[index] = counts.get(index, 0) + 1
+
+    return counts
+
+def get_vertex_group_points(obj, group_indices):
+    """Collect local vertex coordinates of the given vertex groups in a single pass."""
+    group_indices = set(group_indices)
+    points = {index: [] for index in group_indices}
+    for index, v in iter_vertex_group_members(obj):
+        if index in group_indices:
+            points[index].append(v.co.copy())
+
+    return points
+
+def invalidate_collision_registry():
+    global _collision_registry
+    _collision_registry = None
+
+def build_collision_registry():
+    """Map every source object session uid to its collision object names."""
+    global _collision_registry_size
+    _collision_registry_size = len(bpy.data.objects)
+
+    registry = {}
+    pattern = re.compile(r"^UCX_(.+)_\d{2}(\.\d{3})?$")
+
+    for obj in bpy.data.objects:
+        source = obj.get(UCX_SOURCE_PROP)
+
+        if source is None:
+            # Adopt collisions created before the registry existed by their name
+            match = pattern.match(obj.name)
+            source = bpy.data.objects.get(match.group(1)) if match else None
+            if source is None:
+                continue
+
+            if not obj.library:
+                obj[UCX_SOURCE_PROP] = source
+
+        registry.setdefault(source.session_uid, []).append(obj.name)
+
+    return registry
+
+def link_collision(source, collision):
+    """Record source as the owner of a newly created collision object."""
+    global _collision_registry_size
+    collision[UCX_SOURCE_PROP] = source
+
+    if _collision_registry is None:
+        return
+
+    # Any other object added since the last sync still needs a rebuild
+    if len(bpy.data.objects) != _collision_registry_size + 1:
+        invalidate_collision_registry()
+        return
+
+    _collision_registry_size += 1
+    _collision_registry.setdefault(source.session_uid, []).append(collision.name)
+
+def refresh_collision_registry():
+    """Rebuild the registry once if objects were added, removed or renamed since it was built.
+
+    Duplicated or appended collisions only show up as a change in the object
+    count, renamed and deleted ones as entries that no longer resolve.
+    """
+    global _collision_registry
+
+    if _collision_registry is not None and len(bpy.data.objects) == _collision_registry_size:
+        objects = bpy.data.objects
+        if all(name in objects for names in _collision_registry.values() for name in names):
+            return
+
+    _collision_registry = build_collision_registry()
+
+def get_collisions(source):
+    """Return the collision objects of source, call refresh_collision_registry() first."""
+    if _collision_registry is None:
+        refresh_collision_registry()
+
+    collisions = [bpy.data.objects.get(name) for name in _collision_registry.get(source.session_uid, [])]
+
+    return [c for c in collisions if c is not None and c.get(UCX_SOURCE_PROP) == source]
+
+def get_collision_sources(objects):
+    """Resolve objects to their source objects, collisions count as their source."""
+    sources = {}
+    for obj in objects:
+        source = obj.get(UCX_SOURCE_PROP) or obj
+        sources[source.session_uid] = source
+
+    return list(sources.values())
 
 def check_selected_vertices(obj):
     """Check if more than two vertices are selected."""
@@ -66,55 +208,253 @@ def create_new_name(collection, obj_name):
 
     return f"UCX_{obj_name}_{next_number}"
 
-def clean_naming(collection):
-    """Remove .000 suffix from object naming in the collection."""
-    error = 0
+def plan_clean_naming(collection):
+    """Compute the final name of every object with a .000 suffix in the collection.
+
+    UCX_<name>_NN objects keep their number when it is free, otherwise they
+    are numbered after the highest existing number of <name>, like
+    create_new_name(). Other objects only lose the suffix
+    when the plain name is free, linked objects are skipped. Returns a list of (object, new name) and the
+    objects that can not be renamed.
+    """
+    suffix = re.compile(r'\.\d{3}$')
+    ucx_pattern = re.compile(r'^UCX_(.+)_(\d{2,})$')
+
+    taken = {o.name for o in bpy.data.objects}
+    renames = []
+    skipped = []
+    ucx_objects = {}
+
+    # Highest number already used by every source name, suffixed names included
+    highest = {}
+    for name in taken:
+        match = ucx_pattern.match(suffix.sub('', name))
+        if match:
+            number = int(match.group(2))
+            highest[match.group(1)] = max(number, highest.get(match.group(1), number))
+
     for obj in collection.objects:
-        orig_name = obj.name
-        if re.search(r'\.\d{3}$', obj.name):
-            obj.name = re.sub(r'\.\d{3}$', '', obj.name)
+        if not suffix.search(obj.name):
+            continue
+
+        # Linked objects can not be renamed
+        if obj.library:
+            skipped.append(obj)
+            continue
+
+        base = suffix.sub('', obj.name)
+        match = ucx_pattern.match(base)
+
+        if match:
+            ucx_objects.setdefault(match.group(1), []).append((obj, base))
+        elif base not in taken:
+            taken.add(base)
+            renames.append((obj, base))
+        else:
+            skipped.append(obj)
+
+    for source_name, entries in ucx_objects.items():
+        # Objects whose own number is free keep it, the rest are numbered after
+        duplicates = []
+        for obj, base in entries:
+            if base in taken:
+                duplicates.append(obj)
+            else:
+                taken.add(base)
+                renames.append((obj, base))
+
+        next_number = highest[source_name]
+        for obj in duplicates:
+            next_number += 1
+            new_name = f"UCX_{source_name}_{next_number:02d}"
+
+            taken.add(new_name)
+            renames.append((obj, new_name))
 
-            if orig_name == obj.name:
-                error+=1
+    return renames, skipped
 
-    return error
+def clean_naming(collection):
+    """Remove .000 suffix from object naming in the collection.
+
+    Objects are first moved to temporary names so no planned name is still
+    held by another object while renaming. Returns the renamed and failed counts.
+    """
+    # The plan only picks names that are not taken, phase 1 keeps renaming
+    # safe if a planned name ever matches the current name of a planned object
+    renames, skipped = plan_clean_naming(collection)
+
+    taken = {o.name for o in bpy.data.objects}
+    temp_index = 0
+    for obj, _ in renames:
+        while f"UCX_TMP_{temp_index}" in taken:
+            temp_index += 1
+        obj.name = f"UCX_TMP_{temp_index}"
+        temp_index += 1
+
+    renamed = 0
+    for obj, new_name in renames:
+        obj.name = new_name
+        if obj.name == new_name:
+            renamed += 1
+
+    invalidate_collision_registry()
+
+    return renamed, len(skipped) + len(renames) - renamed
+
+def get_next_vertex_group_number(obj):
+    """Return the number following the last UCX_<obj>_VG_NN vertex group."""
+    valid_numbers = []
+    for vg in obj.vertex_groups:
+        if not vg.name.startswith(f"UCX_{obj.name}_VG_"):
+            continue
+
+        try:
+            valid_numbers.append(int(vg.name.split('_')[-1]))
+        except ValueError:
+            continue
+
+    return max(valid_numbers) + 1 if valid_numbers else 0
 
 def add_to_vertex_groups(obj):
     obj = bpy.context.active_object
-    mode = obj.mode
 
-    if not obj.vertex_groups:
-        group_name = f"UCX_{obj.name}_VG_00"
-    else:
-        existing_groups = [vg.name for vg in obj.vertex_groups if vg.name.startswith(f"UCX_{obj.name}_VG_")]
-        if existing_groups:
-            valid_numbers = []
-            for name in existing_groups:
-                try:
-                    num = int(name.split('_')[-1])
-                    valid_numbers.append(num)
-                except ValueError:
-                    continue
-            if valid_numbers:
-                last_num = max(valid_numbers)
-                group_name = f"UCX_{obj.name}_VG_{last_num + 1:02d}"
-            else:
-                group_name = f"UCX_{obj.name}_VG_00"
-        else:
-            group_name = f"UCX_{obj.name}_VG_00"
+    group_name = f"UCX_{obj.name}_VG_{get_next_vertex_group_number(obj):02d}"
     
     # Create a new vertex group
     group = obj.vertex_groups.new(name=group_name)
-    bpy.ops.object.vertex_group_assign()
-    # bpy.ops.object.mode_set(mode='OBJECT')
-    # selected_verts = [v for v in obj.data.vertices if v.select]
-    # for v in selected_verts:
-    #     group.add([v.index], 1.0, 'ADD')
 
-    # bpy.ops.object.mode_set(mode=mode)
+    # Assign selected vertices through the edit BMesh deform layer
+    weight = bpy.context.scene.tool_settings.vertex_group_weight
+    bm = bmesh.from_edit_mesh(obj.data)
+    deform = bm.verts.layers.deform.verify()
+    for v in bm.verts:
+        if v.select:
+            v[deform][group.index] = weight
+
+    bmesh.update_edit_mesh(obj.data)
 
     return group_name
 
+def get_connected_components(count, first, second):
+    """Label count elements so that every first[i], second[i] pair shares a label."""
+    labels = np.arange(count)
+
+    while len(first):
+        # Hook the larger root of every pair onto the smaller one
+        low = np.minimum(labels[first], labels[second])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[first], low)
+        np.minimum.at(hooked, labels[second], low)
+
+        # Pointer jumping until every element points at its root
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+
+        if np.array_equal(hooked, labels):
+            break
+        labels = hooked
+
+    return labels
+
+def get_grouped_pairs(keys, items):
+    """Pair up items that share the same key."""
+    order = np.argsort(keys, kind='stable')
+    same = keys[order[1:]] == keys[order[:-1]]
+    return items[order[:-1]][same], items[order[1:]][same]
+
+def get_face_partitions(mesh, source, attribute_name=""):
+    """Label every face of the mesh with the partition it belongs to.
+
+    Returns None when the mesh has no data for the chosen source.
+    """
+    face_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+
+    if source == 'MATERIAL':
+        labels = np.empty(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get("material_index", labels)
+        return labels
+
+    if source == 'ATTRIBUTE':
+        attribute = mesh.attributes.get(attribute_name)
+        dtypes = {'INT': np.int32, 'INT8': np.int8, 'BOOLEAN': bool}
+        if attribute is None or attribute.domain != 'FACE' or attribute.data_type not in dtypes:
+            return None
+
+        labels = np.empty(face_count, dtype=dtypes[attribute.data_type])
+        attribute.data.foreach_get("value", labels)
+        return labels
+
+    loop_starts = np.empty(face_count, dtype=np.int32)
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_faces = np.repeat(np.arange(face_count), loop_totals)
+
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    if source == 'SHARP':
+        # Faces are connected through every edge that is not marked sharp
+        sharp = np.zeros(len(mesh.edges), dtype=bool)
+        attribute = mesh.attributes.get("sharp_edge")
+        if attribute is not None and attribute.domain == 'EDGE':
+            attribute.data.foreach_get("value", sharp)
+
+        smooth = ~sharp[loop_edges]
+        first, second = get_grouped_pairs(loop_edges[smooth], loop_faces[smooth])
+        return get_connected_components(face_count, first, second)
+
+    if source == 'UV_ISLAND':
+        uv_layer = mesh.uv_layers.active
+        if uv_layer is None:
+            return None
+
+        uv = np.empty(loop_count * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uv)
+        uv = np.round(uv.reshape(-1, 2) * 1e5).astype(np.int64)
+
+        loop_verts = np.empty(loop_count, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+
+        # Faces are connected through an edge when both of its corners share UVs
+        loops = np.arange(loop_count)
+        starts = loop_starts[loop_faces]
+        next_loops = starts + (loops - starts + 1) % loop_totals[loop_faces]
+        flip = loop_verts > loop_verts[next_loops]
+        uv_low = np.where(flip[:, None], uv[next_loops], uv)
+        uv_high = np.where(flip[:, None], uv, uv[next_loops])
+
+        corners = np.column_stack((loop_edges, uv_low, uv_high))
+        _, keys = np.unique(corners, axis=0, return_inverse=True)
+        first, second = get_grouped_pairs(keys.reshape(-1), loop_faces)
+        return get_connected_components(face_count, first, second)
+
+    return None
+
+def get_partition_vertices(mesh, face_labels):
+    """Return the vertex indices of every face partition, one array per partition."""
+    face_count = len(mesh.polygons)
+    vertex_count = len(mesh.vertices)
+    if face_count == 0:
+        return []
+
+    _, face_labels = np.unique(face_labels, return_inverse=True)
+
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    loop_labels = np.repeat(face_labels.reshape(-1).astype(np.int64), loop_totals)
+    members = np.unique(loop_labels * vertex_count + loop_verts)
+    labels = members // vertex_count
+
+    return np.split(members % vertex_count, np.flatnonzero(np.diff(labels)) + 1)
+
 def fetch_vg(scene):
     obj = bpy.context.active_object
 
@@ -140,8 +480,10 @@ def fetch_vg(scene):
     if scene.vertex_group_items:
         scene.vertex_group_items.clear()
     
+    counts = get_vertex_counts(obj)
+
     for vg in obj.vertex_groups:
-        vertex_count = get_vertex_count(obj, vg)
+        vertex_count = counts.get(vg.index, 0)
 
         if vertex_count <= 2:
             continue
@@ -237,22 +579,272 @@ def get_merged_bounding_box(selected_objects, isLocal=True):
     
     return bbox_corners
            
+def get_mesh_points(mesh):
+    """Read all vertex coordinates of a mesh into an (N, 3) array."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+def decimate_points(points, tolerance):
+    """Keep only the lowest and highest point of every column of a 2D grid.
+
+    Columns run along the longest axis of the bounds and are tolerance/sqrt(2)
+    wide. A dropped point lies between the two kept points of its column, so
+    it is within one column diagonal of the segment joining them, which is
+    inside the decimated hull. Returns the kept points and the largest of
+    those distances, an upper bound on how far the decimated hull can deviate
+    from the full hull.
+    """
+    if tolerance <= 0.0 or len(points) < 4:
+        return points, 0.0
+
+    low = points.min(axis=0)
+    axis = int(np.argmax(points.max(axis=0) - low))
+    a, b = [i for i in range(3) if i != axis]
+    across_a = np.ascontiguousarray(points[:, a])
+    across_b = np.ascontiguousarray(points[:, b])
+    height = np.ascontiguousarray(points[:, axis])
+
+    # Column diagonal equals the tolerance
+    width = tolerance / 2 ** 0.5
+    cells_a = ((across_a - low[a]) / width).astype(np.int64)
+    cells_b = ((across_b - low[b]) / width).astype(np.int64)
+    keys = cells_a * (int(cells_b.max()) + 1) + cells_b
+    column_count = int(keys.max()) + 1
+
+    top = np.full(column_count, -np.inf, dtype=height.dtype)
+    bottom = np.full(column_count, np.inf, dtype=height.dtype)
+    np.maximum.at(top, keys, height)
+    np.minimum.at(bottom, keys, height)
+
+    is_top = height == top[keys]
+    is_bottom = height == bottom[keys]
+    kept = is_top | is_bottom
+
+    # One kept index per column end, used to measure the dropped points
+    top_index = np.empty(column_count, dtype=np.int64)
+    bottom_index = np.empty(column_count, dtype=np.int64)
+    top_index[keys[is_top]] = np.flatnonzero(is_top)
+    bottom_index[keys[is_bottom]] = np.flatnonzero(is_bottom)
+
+    # The segment point at the same height differs from a dropped point only across the column
+    dropped = np.flatnonzero(~kept)
+    deviation = 0.0
+
+    if len(dropped):
+        start = bottom_index[keys[dropped]]
+        end = top_index[keys[dropped]]
+        t = (height[dropped] - height[start]) / (height[end] - height[start])
+        offset_a = across_a[dropped] - (across_a[start] + t * (across_a[end] - across_a[start]))
+        offset_b = across_b[dropped] - (across_b[start] + t * (across_b[end] - across_b[start]))
+        deviation = float(np.sqrt((offset_a * offset_a + offset_b * offset_b).max()))
+
+    return points[kept], deviation
+
+# Generic direction so that near ties in the sort order stay rare
+SYMMETRY_SORT_DIRECTION = np.array([1.0, 0.6180339887, 0.4142135624], dtype=np.float32)
+
+def sort_point_set(points):
+    """Return points as compact float32 sorted along SYMMETRY_SORT_DIRECTION, with the projections."""
+    points = np.asarray(points, dtype=np.float32)
+    projections = points @ SYMMETRY_SORT_DIRECTION
+    order = np.argsort(projections, kind='stable')
+
+    return points[order], projections[order]
+
+def points_covered(points, projections, target, target_projections, tolerance):
+    """True when every point lies within tolerance of a point of the sorted target set."""
+    window = tolerance * float(SYMMETRY_SORT_DIRECTION.sum())
+    starts = np.searchsorted(target_projections, projections - window, side='left')
+    ends = np.searchsorted(target_projections, projections + window, side='right')
+
+    # Walk all windows at once, one offset per pass
+    pending = np.arange(len(points))
+    offset = 0
+    while len(pending):
+        pending = pending[starts[pending] + offset < ends[pending]]
+        if not len(pending):
+            return False
+
+        candidates = target[starts[pending] + offset]
+        found = np.all(np.abs(candidates - points[pending]) <= tolerance, axis=1)
+        pending = pending[~found]
+        offset += 1
+
+    return True
+
+def point_sets_match(first, second, tolerance):
+    """True when every point of both sorted sets lies within tolerance of a point of the other.
+
+    Sets sorted the same way are compared pair by pair, only points that
+    swapped places with a close neighbour are looked up in a window of the
+    other set.
+    """
+    points, projections = first
+    other_points, other_projections = second
+
+    if len(points) != len(other_points):
+        return False
+
+    close = np.all(np.abs(points - other_points) <= tolerance, axis=1)
+    if close.all():
+        return True
+
+    misses = np.flatnonzero(~close)
+
+    return (points_covered(points[misses], projections[misses], other_points, other_projections, tolerance)
+            and points_covered(other_points[misses], other_projections[misses], points, projections, tolerance))
+
+def mirror_bmesh(bm, axis):
+    """Return a copy of bm reflected across the local axis plane with flipped winding."""
+    scale = [1.0, 1.0, 1.0]
+    scale[axis] = -1.0
+
+    mirrored = bm.copy()
+    bmesh.ops.scale(mirrored, vec=scale, verts=mirrored.verts)
+    bmesh.ops.reverse_faces(mirrored, faces=mirrored.faces)
+
+    return mirrored
+
+def copy_hull_faces(bm):
+    """Copy of bm without the loose input points left inside the hull."""
+    hull = bm.copy()
+    bmesh.ops.delete(hull, geom=[v for v in hull.verts if not v.link_faces], context='VERTS')
+
+    return hull
+
+class MirroredHulls:
+    """Reuse the hull of a point set for later sets that repeat or mirror it.
+
+    Every set is compared when it gets hulled, so the work is spread over the
+    batch steps. Only sets whose vertex count still comes up later in the
+    batch are cached, and a count's cache is dropped with its last set.
+    """
+
+    def __init__(self, context, counts):
+        symmetry = context.scene.ucx_symmetry
+        self.axis = SYMMETRY_AXES.get(symmetry.ucx_symmetry_axis)
+        self.tolerance = symmetry.ucx_symmetry_tolerance
+        self.remaining = {}
+        self.candidates = {}
+
+        for count in counts:
+            self.remaining[count] = self.remaining.get(count, 0) + 1
+
+    def find(self, points):
+        """Return the cached (key, sorted points, hull, deviation) equal to points, and if it is mirrored."""
+        originals = self.candidates.get(len(points))
+        if not originals:
+            return None
+
+        mirrored = points.copy()
+        mirrored[:, self.axis] *= -1.0
+
+        for test, is_mirror in ((points, False), (mirrored, True)):
+            test_set = sort_point_set(test)
+            low = test.min(axis=0) - self.tolerance
+            high = test.max(axis=0) + self.tolerance
+
+            for original in originals:
+                original_points = original[1][0]
+                if np.any(original_points.min(axis=0) < low) or np.any(original_points.max(axis=0) > high):
+                    continue
+
+                if point_sets_match(test_set, original[1], self.tolerance):
+                    return original, is_mirror
+
+        return None
+
+    def hull(self, key, get_points, count, build):
+        """Return (BMesh, deviation) for key, calling build() only when no match is cached."""
+        self.remaining[count] = self.remaining.get(count, 1) - 1
+        if self.axis is None or count == 0 or count > SYMMETRY_MAX_POINTS:
+            return build()
+
+        points = np.asarray(get_points(), dtype=np.float32).reshape(-1, 3)
+
+        match = self.find(points)
+        if match:
+            (original, _, hull, deviation), is_mirror = match
+            print(f"Reused hull of {original} for {key}")
+            bm = mirror_bmesh(hull, self.axis) if is_mirror else hull.copy()
+        else:
+            bm, deviation = build()
+            if self.remaining[count] > 0:
+                self.candidates.setdefault(count, []).append((key, sort_point_set(points), copy_hull_faces(bm), deviation))
+
+        if self.remaining[count] <= 0:
+            self.drop(count)
+
+        return bm, deviation
+
+    def drop(self, count):
+        for _, _, hull, _ in self.candidates.pop(count, []):
+            hull.free()
+
+    def free(self):
+        for count in list(self.candidates):
+            self.drop(count)
+
+def build_points_hull(points):
+    """Build the convex hull BMesh of a list of points."""
+    bm = bmesh.new()
+    for co in points:
+        bm.verts.new(co)
+
+    bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
+
+    return bm, None
+
+def build_object_hull(obj, context):
+    """Build the convex hull BMesh of an object's mesh in local space.
+
+    Returns the BMesh and the maximum deviation introduced by decimation, or
+    None when the full mesh was used.
+    """
+    decimate = context.scene.ucx_chkbox_decimate
+    deviation = None
+
+    bm = bmesh.new()
+    if decimate.ucx_chkbox_decimate:
+        # Only the decimated points go into the hull, loaded through a temporary mesh
+        points, deviation = decimate_points(get_mesh_points(obj.data), decimate.ucx_decimate_tolerance)
+        mesh = bpy.data.meshes.new(obj.data.name)
+        mesh.vertices.add(len(points))
+        mesh.vertices.foreach_set("co", points.ravel())
+        bm.from_mesh(mesh)
+        bpy.data.meshes.remove(mesh)
+        print(f"Decimated {len(obj.data.vertices)} -> {len(points)} points (max deviation {deviation:.6f})")
+    else:
+        bm.from_mesh(obj.data)
+
+    bmesh.ops.convex_hull(bm, input=bm.verts)
+
+    return bm, deviation
+
 # Collision Creation Functions
-def create_collision_box(collection, obj, context):
-    """Create a collision box from the entire object."""
+def create_collision_box(collection, obj, context, mirrored_hulls=None):
+    """Create a collision box from the entire object.
+
+    Returns the maximum deviation introduced by decimation, or None when the
+    full mesh was used.
+    """
     if obj.type != 'MESH':
         raise Exception("Selected object is not a mesh!")
     
     # Duplicate the object
     new_obj = obj.copy()
-    new_obj.data = obj.data.copy()
+    new_obj.data = bpy.data.meshes.new(obj.data.name)
     new_obj.name = f"UCX_{obj.name}_00"
     collection.objects.link(new_obj)
+    link_collision(obj, new_obj)
     
     # Create a convex hull
-    bm = bmesh.new()
-    bm.from_mesh(new_obj.data)
-    bmesh.ops.convex_hull(bm, input=bm.verts)
+    build = lambda: build_object_hull(obj, context)
+    if mirrored_hulls:
+        bm, deviation = mirrored_hulls.hull(obj.session_uid, lambda: get_mesh_points(obj.data), len(obj.data.vertices), build)
+    else:
+        bm, deviation = build()
     bm.to_mesh(new_obj.data)
     bm.free()
     
@@ -273,6 +865,8 @@ def create_collision_box(collection, obj, context):
 
     print(f"Created collision box: {new_obj.name}")
 
+    return deviation
+
 def create_bounding_box_cube(collection, obj, context):
     """Create a convex hull using the bounding box of the selected object."""
     if obj.type != 'MESH':
@@ -294,6 +888,7 @@ def create_bounding_box_cube(collection, obj, context):
     new_mesh = bpy.data.meshes.new(create_new_name(collection, obj.name))
     new_obj = bpy.data.objects.new(new_mesh.name, new_mesh)
     collection.objects.link(new_obj)
+    link_collision(obj, new_obj)
     
     # Create a bmesh and add the bounding box corners as vertices
     bm = bmesh.new()
@@ -332,54 +927,67 @@ def create_bounding_box_cube(collection, obj, context):
 
     print(f"Created convex hull from bounds: {new_obj.name}")
 
-def create_collision_from_vertex_groups(collection, context, isFromList = False):
-    """Create collision meshes from vertex groups."""
+def get_vertex_group_work_items(obj, context, isFromList = False):
+    """Return (vertex group, points) of every group of obj that should get a collision.
 
-    obj = context.active_object
+    Groups are filtered by name first, so the points of the rest are
+    gathered in a single pass over the mesh.
+    """
+    vgroups = []
 
     for vg in obj.vertex_groups:
-        if get_vertex_count(obj, vg) <= 2:
-            continue
-
         if context.scene.ucx_chkbox.ucx_chkbox and "UCX_" not in vg.name:
             continue
 
         if isFromList and len([vgl for vgl in context.scene.vertex_group_items if vgl.vertex_group_name == vg.name]) == 0:
             continue
-        
-        # Create a new mesh from the vertex group
-        new_mesh = bpy.data.meshes.new(create_new_name(collection, obj.name))
-        new_obj = bpy.data.objects.new(new_mesh.name, new_mesh)
-        collection.objects.link(new_obj)
-        
-        # Select vertices in the vertex group
-        bm = bmesh.new()
-        #bm.from_mesh(obj.data)
 
-        selected_verts = [v for v in obj.data.vertices if vg.index in [g.group for g in v.groups]]
-        
-        # Create a convex hull
-        for v in selected_verts:
-            bm.verts.new(v.co)
-            
-        # Create faces from the selected vertices
-        #bmesh.ops.contextual_create(bm, geom=bm.verts)    
-        bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
+        vgroups.append(vg)
 
-        bm.to_mesh(new_mesh)
-        bm.free()
+    points = get_vertex_group_points(obj, [vg.index for vg in vgroups])
 
-        new_obj.location = obj.location
-        new_obj.rotation_euler = obj.rotation_euler
-        new_obj.scale = obj.scale
-        
-        if context.scene.ucx_chkbox_autohide.ucx_chkbox_autohide:
-            new_obj.hide_set(True)
+    return [(vg, points[vg.index]) for vg in vgroups if len(points[vg.index]) > 2]
+
+def create_collision_from_vertex_group(collection, obj, vg_name, points, context, mirrored_hulls=None):
+    """Create a collision mesh from the points of a single vertex group."""
+
+    # Create a new mesh from the vertex group
+    new_mesh = bpy.data.meshes.new(create_new_name(collection, obj.name))
+    new_obj = bpy.data.objects.new(new_mesh.name, new_mesh)
+    collection.objects.link(new_obj)
+    link_collision(obj, new_obj)
+    
+    # Create a convex hull
+    build = lambda: build_points_hull(points)
+    bm, _ = mirrored_hulls.hull(vg_name, lambda: points, len(points), build) if mirrored_hulls else build()
+
+    bm.to_mesh(new_mesh)
+    bm.free()
+
+    new_obj.location = obj.location
+    new_obj.rotation_euler = obj.rotation_euler
+    new_obj.scale = obj.scale
+    
+    if context.scene.ucx_chkbox_autohide.ucx_chkbox_autohide:
+        new_obj.hide_set(True)
+
+    # Clean up unnecessary data
+    clean_up_object_data(new_obj)
+
+    print(f"Created collision box: {new_obj.name}")
 
-        # Clean up unnecessary data
-        clean_up_object_data(new_obj)
+def create_collision_from_vertex_groups(collection, context, isFromList = False):
+    """Create collision meshes from vertex groups."""
+
+    obj = context.active_object
+
+    items = get_vertex_group_work_items(obj, context, isFromList)
+    mirrored_hulls = MirroredHulls(context, [len(points) for _, points in items])
 
-        print(f"Created collision box: {new_obj.name}")
+    for vg, points in items:
+        create_collision_from_vertex_group(collection, obj, vg.name, points, context, mirrored_hulls)
+
+    mirrored_hulls.free()
 
 def create_collision_from_selected_vertices(collection, obj, context):
     """Create a collision mesh from selected vertices."""
@@ -393,6 +1001,7 @@ def create_collision_from_selected_vertices(collection, obj, context):
     new_mesh = bpy.data.meshes.new(create_new_name(collection, obj.name))
     new_obj = bpy.data.objects.new(new_mesh.name, new_mesh)
     collection.objects.link(new_obj)
+    link_collision(obj, new_obj)
     
     # Create a convex hull
     bm_new = bmesh.new()
@@ -414,6 +1023,145 @@ def create_collision_from_selected_vertices(collection, obj, context):
     
     print(f"Created collision box: {new_obj.name}")
 
+# Batch Processing
+class UCX_BatchModal:
+    """Mixin that runs an operator's work items in time-sliced chunks on a timer.
+
+    Operators provide batch_items() and batch_step(). When the Background
+    batch option is off, invoke falls back to the synchronous execute.
+    """
+    _timer = None
+    _items = None
+    _index = 0
+    _deviation = None
+    _mirrored_hulls = None
+    _collection_name = ""
+
+    def batch_items(self, context):
+        return []
+
+    def batch_step(self, context, collection, item):
+        """Process one item, optionally returning the decimation deviation."""
+        return None
+
+    def invoke(self, context, event):
+        if not context.scene.ucx_chkbox_modal.ucx_chkbox_modal:
+            return self.execute(context)
+
+        collection = bpy.data.collections.get(context.scene.ucx_collection)
+        if not collection:
+            self.report({'ERROR'}, "No collection selected!")
+            return {'CANCELLED'}
+
+        self._collection_name = collection.name
+        self._items = self.batch_items(context)
+        self._index = 0
+        self._deviation = None
+
+        if not self._items:
+            self.report({'WARNING'}, "Nothing to create!")
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self._items))
+        self._timer = wm.event_timer_add(BATCH_TIMER_STEP, window=context.window)
+        wm.modal_handler_add(self)
+        self.batch_status(context)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        total = len(self._items)
+
+        if event.type == 'ESC':
+            self.batch_finish(context)
+            self.report({'WARNING'}, f"Cancelled: created {self._index} of {total} collisions{self.batch_deviation()}")
+            return {'FINISHED'}
+
+        if event.type != 'TIMER' or event.timer != self._timer:
+            return {'PASS_THROUGH'}
+
+        collection = bpy.data.collections.get(self._collection_name)
+        if not collection:
+            return self.batch_stop(context, f"Collection was removed after {self._index} of {total} collisions!")
+
+        # Process as many items as fit in the time slice, at least one per tick
+        deadline = time.perf_counter() + BATCH_TIME_SLICE
+        try:
+            while self._index < total:
+                deviation = self.batch_step(context, collection, self._items[self._index])
+                if deviation is not None:
+                    self._deviation = max(deviation, self._deviation or 0.0)
+                self._index += 1
+
+                if time.perf_counter() >= deadline:
+                    break
+        except Exception as e:
+            return self.batch_stop(context, f"Stopped after {self._index} of {total} collisions: {e}")
+
+        context.window_manager.progress_update(self._index)
+        self.batch_status(context)
+
+        if self._index >= total:
+            self.batch_finish(context)
+            self.report({'INFO'}, f"Created {total} collisions{self.batch_deviation()}")
+            return {'FINISHED'}
+
+        return {'RUNNING_MODAL'}
+
+    def batch_stop(self, context, message):
+        self.batch_finish(context)
+        self.report({'ERROR'}, message)
+
+        # Finishing keeps an undo step for the collisions that were already created
+        return {'FINISHED'} if self._index > 0 else {'CANCELLED'}
+
+    def batch_deviation(self):
+        if self._deviation is None:
+            return ""
+
+        return f", max deviation {self._deviation:.6f}"
+
+    def batch_status(self, context):
+        context.workspace.status_text_set(f"UCX: {self._index}/{len(self._items)} collisions (Esc to cancel)")
+
+    def batch_finish(self, context):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+        if context.area:
+            context.area.tag_redraw()
+
+        if self._mirrored_hulls:
+            self._mirrored_hulls.free()
+            self._mirrored_hulls = None
+
+class UCX_VGroupBatchModal(UCX_BatchModal):
+    """Batch work items shared by the vertex group operators, one item per group."""
+    is_from_list = False
+
+    def batch_items(self, context):
+        obj = context.active_object
+        self._object_name = obj.name
+
+        items = get_vertex_group_work_items(obj, context, self.is_from_list)
+        self._points = {vg.name: points for vg, points in items}
+        self._mirrored_hulls = MirroredHulls(context, [len(p) for p in self._points.values()])
+
+        return list(self._points)
+
+    def batch_step(self, context, collection, item):
+        obj = bpy.data.objects.get(self._object_name)
+        if not obj:
+            return None
+
+        create_collision_from_vertex_group(collection, obj, item, self._points[item], context, self._mirrored_hulls)
+        return None
+
 # Operators
 class UCX_OT_CreateCollection(Operator):
     bl_label = ""
@@ -427,7 +1175,7 @@ class UCX_OT_CreateCollection(Operator):
         context.scene.ucx_collection = new_collection.name
         return {'FINISHED'}
 
-class UCX_OT_CreateFromObject(Operator):
+class UCX_OT_CreateFromObject(UCX_BatchModal, Operator):
     bl_label = "From Selected Objects"
     bl_idname = "object.create_from_object"
     bl_description = "Create collisions from selected objects"
@@ -443,17 +1191,54 @@ class UCX_OT_CreateFromObject(Operator):
             self.report({'ERROR'}, "No collection selected!")
             return {'CANCELLED'}
         
+        max_deviation = None
+        mirrored_hulls = self.mirrored_hulls(context)
+
         for s_obj in context.selected_objects:
             if context.scene.ucx_chkbox_bounding.ucx_chkbox_bounding:
                 create_bounding_box_cube(collection, s_obj, context)
             else:
-                create_collision_box(collection, s_obj, context) 
+                deviation = create_collision_box(collection, s_obj, context, mirrored_hulls)
+                if deviation is not None:
+                    max_deviation = max(deviation, max_deviation or 0.0)
             
             if context.scene.ucx_chkbox_merge.ucx_chkbox_merge:
                 break
 
+        if mirrored_hulls:
+            mirrored_hulls.free()
+
+        if max_deviation is not None:
+            self.report({'INFO'}, f"Decimated hulls, max deviation {max_deviation:.6f}")
+
         return {'FINISHED'}
 
+    def mirrored_hulls(self, context):
+        if context.scene.ucx_chkbox_bounding.ucx_chkbox_bounding or context.scene.ucx_chkbox_merge.ucx_chkbox_merge:
+            return None
+
+        return MirroredHulls(context, [len(o.data.vertices) for o in context.selected_objects if o.type == 'MESH'])
+
+    def batch_items(self, context):
+        items = [o.name for o in context.selected_objects if o.type == 'MESH']
+
+        if context.scene.ucx_chkbox_merge.ucx_chkbox_merge:
+            return items[:1]
+
+        self._mirrored_hulls = self.mirrored_hulls(context)
+
+        return items
+
+    def batch_step(self, context, collection, item):
+        s_obj = bpy.data.objects.get(item)
+        if not s_obj:
+            return
+
+        if context.scene.ucx_chkbox_bounding.ucx_chkbox_bounding:
+            create_bounding_box_cube(collection, s_obj, context)
+        else:
+            return create_collision_box(collection, s_obj, context, self._mirrored_hulls)
+
 class UCX_OT_CreateFromSelectedVertices(Operator):
     bl_label = "From Selected Vertices"
     bl_idname = "object.create_from_selectedvert"
@@ -473,7 +1258,7 @@ class UCX_OT_CreateFromSelectedVertices(Operator):
         create_collision_from_selected_vertices(collection, context.active_object, context)
         return {'FINISHED'}
 
-class UCX_OT_CreateFromVGroups(Operator):
+class UCX_OT_CreateFromVGroups(UCX_VGroupBatchModal, Operator):
     bl_label = "From Existing VGroups"
     bl_idname = "object.create_from_vgroups"
     bl_description = "Create collisions from existing Vertex groups can be filtered by checking the box"
@@ -492,11 +1277,12 @@ class UCX_OT_CreateFromVGroups(Operator):
         create_collision_from_vertex_groups(collection, context)
         return {'FINISHED'}
 
-class UCX_OT_CreateFromVGList(bpy.types.Operator):
+class UCX_OT_CreateFromVGList(UCX_VGroupBatchModal, bpy.types.Operator):
     bl_label = "From Custom VG List"
     bl_idname = "object.create_from_vglist"
     bl_description = "Still Fetch all existing VG but has ability to remove unwanted group"
     bl_options = {"REGISTER", "UNDO"}
+    is_from_list = True
     
     @classmethod
     def poll(cls, context):
@@ -533,8 +1319,81 @@ class UCX_OT_CleanNaming(bpy.types.Operator):
         collection_name = context.scene.ucx_collection
         collection = bpy.data.collections.get(collection_name)
 
-        if clean_naming(collection) > 0:
-            self.report({'WARNING'}, "Renaming Failed. Some of the objects is existed!")
+        if not collection:
+            self.report({'ERROR'}, "No collection selected!")
+            return {'CANCELLED'}
+
+        renamed, failed = clean_naming(collection)
+
+        if failed > 0:
+            self.report({'WARNING'}, f"Renamed {renamed} objects, {failed} failed because their names already exist!")
+        else:
+            self.report({'INFO'}, f"Renamed {renamed} objects")
+
+        return {'FINISHED'}
+
+class UCX_OT_ManageCollisions(bpy.types.Operator):
+    bl_idname = "object.manage_collisions"
+    bl_label = "Manage Collisions"
+    bl_description = "Select, isolate, show, hide or delete the collisions of the selected objects"
+    bl_options = {"REGISTER", "UNDO"}
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=(
+            ('SELECT', "Select", "Select the collisions of the selected objects"),
+            ('ISOLATE', "Isolate", "Show and select the collisions, hide every other object"),
+            ('SHOW', "Show", "Show the collisions of the selected objects"),
+            ('HIDE', "Hide", "Hide the collisions of the selected objects"),
+            ('DELETE', "Delete", "Delete the collisions of the selected objects"),
+        ),
+        default='SELECT'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and context.selected_objects
+
+    def execute(self, context):
+        refresh_collision_registry()
+
+        sources = get_collision_sources(context.selected_objects)
+        collisions = [c for source in sources for c in get_collisions(source)]
+
+        if not collisions:
+            self.report({'WARNING'}, "No collisions found for the selected objects!")
+            return {'CANCELLED'}
+
+        if self.action == 'DELETE':
+            for c in collisions:
+                bpy.data.objects.remove(c, do_unlink=True)
+
+            invalidate_collision_registry()
+
+            self.report({'INFO'}, f"Deleted {len(collisions)} collisions")
+            return {'FINISHED'}
+
+        view_layer_objects = context.view_layer.objects
+        collisions = [c for c in collisions if c.name in view_layer_objects]
+
+        if self.action in {'SELECT', 'ISOLATE'}:
+            for obj in context.selected_objects:
+                obj.select_set(False)
+
+        if self.action == 'ISOLATE':
+            targets = {c.name for c in collisions}
+            for obj in view_layer_objects:
+                if obj.name not in targets:
+                    obj.hide_set(True)
+
+        for c in collisions:
+            c.hide_set(self.action == 'HIDE')
+
+            if self.action in {'SELECT', 'ISOLATE'}:
+                c.select_set(True)
+
+        if self.action in {'SELECT', 'ISOLATE'} and collisions:
+            view_layer_objects.active = collisions[0]
 
         return {'FINISHED'}
 
@@ -579,6 +1438,67 @@ class UCX_OT_AddToVertexGroup(bpy.types.Operator):
         
         return {'FINISHED'}
 
+class UCX_OT_AddVGroupsFromPartitions(bpy.types.Operator):
+    bl_label = "Add VGs from Partitions"
+    bl_idname = "object.add_vg_from_partitions"
+    bl_description = "Create one UCX_ vertex group per material slot, UV island, face attribute value or sharp-edge region"
+    bl_options = {"REGISTER", "UNDO"}
+
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=(
+            ('MATERIAL', "Material Slots", "One group per material slot used by the faces"),
+            ('UV_ISLAND', "UV Islands", "One group per island of the active UV map"),
+            ('ATTRIBUTE', "Face Attribute", "One group per value of an integer or boolean face attribute"),
+            ('SHARP', "Sharp-Edge Regions", "One group per region bounded by sharp edges"),
+        ),
+        default='MATERIAL'
+    )
+
+    attribute_name: bpy.props.StringProperty(
+        name="Attribute",
+        description="Integer or boolean face attribute to split by"
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object and context.active_object.type == 'MESH' and context.mode == 'OBJECT'
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "source")
+
+        if self.source == 'ATTRIBUTE':
+            layout.prop_search(self, "attribute_name", context.active_object.data, "attributes")
+
+    def execute(self, context):
+        obj = context.active_object
+
+        face_labels = get_face_partitions(obj.data, self.source, self.attribute_name)
+        if face_labels is None:
+            self.report({'ERROR'}, "Mesh has no data for the chosen source!")
+            return {'CANCELLED'}
+
+        next_number = get_next_vertex_group_number(obj)
+        created = 0
+
+        for vertices in get_partition_vertices(obj.data, face_labels):
+            if len(vertices) <= 2:
+                continue
+
+            group = obj.vertex_groups.new(name=f"UCX_{obj.name}_VG_{next_number:02d}")
+            group.add(vertices.tolist(), 1.0, 'REPLACE')
+            next_number += 1
+            created += 1
+
+        fetch_vg(context.scene)
+        self.report({'INFO'}, f"Created {created} vertex groups")
+
+        return {'FINISHED'}
+
 class UCX_OT_FetchVG(bpy.types.Operator):
     bl_idname = "object.fetch_vertex_groups"
     bl_label = ""
@@ -594,8 +1514,10 @@ class UCX_OT_FetchVG(bpy.types.Operator):
         
         context.scene.vertex_group_items.clear()
         
+        counts = get_vertex_counts(obj)
+
         for vg in obj.vertex_groups:
-            if get_vertex_count(obj, vg) <= 2:
+            if counts.get(vg.index, 0) <= 2:
                 continue
 
             if context.scene.ucx_chkbox.ucx_chkbox and "UCX_" not in vg.name:
@@ -642,6 +1564,49 @@ class UCX_UL_UCXCheckboxAutohide(bpy.types.PropertyGroup):
         default = True
     )
 
+class UCX_UL_UCXCheckboxDecimate(bpy.types.PropertyGroup):
+    ucx_chkbox_decimate : bpy.props.BoolProperty(
+        name="Decimate",
+        description="Reduce dense meshes to the outermost points of a fine grid before building the hull",
+        default = False
+    )
+    ucx_decimate_tolerance : bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Maximum distance between the decimated hull and the full hull",
+        default = 0.01,
+        min = 0.0,
+        precision = 4,
+        subtype = 'DISTANCE'
+    )
+
+class UCX_UL_UCXSymmetry(bpy.types.PropertyGroup):
+    ucx_symmetry_axis : bpy.props.EnumProperty(
+        name="Symmetry",
+        description="Reuse the hull of vertex groups or objects that repeat or mirror an earlier one across this local axis",
+        items=(
+            ('NONE', "None", "Compute every hull"),
+            ('X', "X", "Mirror across the local X axis"),
+            ('Y', "Y", "Mirror across the local Y axis"),
+            ('Z', "Z", "Mirror across the local Z axis"),
+        ),
+        default = 'NONE'
+    )
+    ucx_symmetry_tolerance : bpy.props.FloatProperty(
+        name="Symmetry Tolerance",
+        description="Distance under which mirrored vertices count as equal",
+        default = 0.0001,
+        min = 0.000001,
+        precision = 6,
+        subtype = 'DISTANCE'
+    )
+
+class UCX_UL_UCXCheckboxModal(bpy.types.PropertyGroup):
+    ucx_chkbox_modal : bpy.props.BoolProperty(
+        name="Background batch",
+        description="Create collisions in small chunks with progress, press Esc to cancel and keep created ones",
+        default = False
+    )
+
 class UCX_PG_VertexGroupItems(bpy.types.PropertyGroup):
     vertex_group_name: bpy.props.StringProperty(name="Vertex Group Name")
 
@@ -670,6 +1635,14 @@ class UCX_PT_Panel(Panel):
         bounding_row.prop(scene.ucx_chkbox_bounding, "ucx_chkbox_bounding", text="Bounding Box")
         bounding_row.prop(scene.ucx_chkbox_merge, "ucx_chkbox_merge", text="Merge")
 
+        decimate_row = layout.row()
+        decimate_row.prop(scene.ucx_chkbox_decimate, "ucx_chkbox_decimate", text="Decimate")
+        decimate_row.prop(scene.ucx_chkbox_decimate, "ucx_decimate_tolerance", text="")
+
+        symmetry_row = layout.row()
+        symmetry_row.prop(scene.ucx_symmetry, "ucx_symmetry_axis", text="Symmetry")
+        symmetry_row.prop(scene.ucx_symmetry, "ucx_symmetry_tolerance", text="")
+
         layout.operator("object.create_from_object")
 
         layout.separator()
@@ -706,10 +1679,23 @@ class UCX_PT_Panel(Panel):
 
         layout.operator("object.add_to_vg")
 
+        layout.operator("object.add_vg_from_partitions")
+
         layout.operator("object.clean_naming")
 
+        layout.label(text="Collisions of Selected:")
+
+        collisions_row = layout.row(align=True)
+        collisions_row.operator("object.manage_collisions", text="Select").action = 'SELECT'
+        collisions_row.operator("object.manage_collisions", text="Isolate").action = 'ISOLATE'
+        collisions_row.operator("object.manage_collisions", text="", icon='HIDE_OFF').action = 'SHOW'
+        collisions_row.operator("object.manage_collisions", text="", icon='HIDE_ON').action = 'HIDE'
+        collisions_row.operator("object.manage_collisions", text="", icon='TRASH').action = 'DELETE'
+
         layout.prop(scene.ucx_chkbox_autohide, "ucx_chkbox_autohide", text="Auto-hide created collisions")
 
+        layout.prop(scene.ucx_chkbox_modal, "ucx_chkbox_modal", text="Background batch (Esc to cancel)")
+
 # Registration
 classes = (
     UCX_OT_CreateCollection,
@@ -718,13 +1704,18 @@ classes = (
     UCX_OT_CreateFromSelectedVertices,
     UCX_OT_CleanNaming,
     UCX_OT_AddToVertexGroup,
+    UCX_OT_AddVGroupsFromPartitions,
     UCX_OT_FetchVG,
     UCX_OT_CreateFromVGList,
     UCX_OT_RemoveVGEntry,
+    UCX_OT_ManageCollisions,
     UCX_UL_UCXCheckbox,
     UCX_UL_UCXCheckboxBounding,
     UCX_UL_UCXCheckboxMerge,
     UCX_UL_UCXCheckboxAutohide,
+    UCX_UL_UCXCheckboxDecimate,
+    UCX_UL_UCXSymmetry,
+    UCX_UL_UCXCheckboxModal,
     UCX_UL_VGField,
     UCX_PG_VertexGroupItems,
     UCX_PT_Panel,
@@ -769,6 +1760,12 @@ def register():
 
     bpy.types.Scene.ucx_chkbox_autohide = bpy.props.PointerProperty(type=UCX_UL_UCXCheckboxAutohide)
 
+    bpy.types.Scene.ucx_chkbox_decimate = bpy.props.PointerProperty(type=UCX_UL_UCXCheckboxDecimate)
+
+    bpy.types.Scene.ucx_symmetry = bpy.props.PointerProperty(type=UCX_UL_UCXSymmetry)
+
+    bpy.types.Scene.ucx_chkbox_modal = bpy.props.PointerProperty(type=UCX_UL_UCXCheckboxModal)
+
     bpy.types.Scene.vertex_group_items = bpy.props.CollectionProperty(type=UCX_PG_VertexGroupItems)
 
     bpy.types.Scene.last_active_object = bpy.props.PointerProperty(type=bpy.types.Object)
@@ -779,6 +1776,12 @@ def register():
 
     bpy.app.handlers.depsgraph_update_post.append(on_checkbox_changed)
 
+    bpy.app.handlers.load_post.append(on_load_post)
+
+    bpy.app.handlers.undo_post.append(on_undo_redo)
+
+    bpy.app.handlers.redo_post.append(on_undo_redo)
+
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -792,6 +1795,9 @@ def unregister():
     del bpy.types.Scene.ucx_chkbox_bounding
     del bpy.types.Scene.ucx_chkbox_merge
     del bpy.types.Scene.ucx_chkbox_autohide
+    del bpy.types.Scene.ucx_chkbox_decimate
+    del bpy.types.Scene.ucx_symmetry
+    del bpy.types.Scene.ucx_chkbox_modal
     del bpy.types.Scene.vertex_group_items
 
     if on_selection_changed in bpy.app.handlers.depsgraph_update_post:
@@ -804,5 +1810,16 @@ def unregister():
 
     del bpy.types.Scene.last_checkbox_value
 
+    if on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(on_load_post)
+
+    if on_undo_redo in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(on_undo_redo)
+
+    if on_undo_redo in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(on_undo_redo)
+
+    invalidate_collision_registry()
+
 if __name__ == "__main__":
     register()
\ No newline at end of file